@@ -0,0 +1,8 @@
+# Copyright (C) 2022 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
+
+"""NoteWizard application package.
+
+Installed as the ``notewizard`` package (see pyproject.toml); in the
+source tree the modules also run flat via ``python env/main.py``.
+"""
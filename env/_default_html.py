@@ -0,0 +1,16 @@
+# Default document for NoteWizard, frozen as a bytes literal so the
+# common no-argument launch never touches the Qt resource system.
+# Regenerate by pasting the contents of example.html between the quotes.
+
+DEFAULT_HTML = b"""\
+<html>
+<head><meta charset="utf-8"><title>NoteWizard</title></head>
+<body>
+<h1>NoteWizard</h1>
+<p>NoteWizard aims to make the creation and organization of notes
+easier.</p>
+<p>Use <b>File &gt; Open...</b> to load an existing note, or just start
+typing. Notes can be saved as HTML, Markdown, ODT or plain text.</p>
+</body>
+</html>
+"""
@@ -3,44 +3,162 @@
 
 """PySide6 port of the widgets/richtext/textedit example from Qt v6.x"""
 
+import os
 import sys
-from argparse import ArgumentParser, RawTextHelpFormatter
 
-from PySide6.QtCore import QCoreApplication, qVersion
-from PySide6.QtWidgets import QApplication, QWidget
+# import textedit_rc  # noqa: F401
 
-from textedit import TextEdit
+_ORG = "QtProject"
+_APP = "NoteWizard"
+_DEFAULT_FILE = ":/example.html"
 
-# import textedit_rc  # noqa: F401
-class SetupWidget(QWidget):
-    def __init__(self):
-        super().__init__()
-
-        self.setWindowTitle("NoteWizard")
-        self.argument_parser = ArgumentParser(description='Rich Text Example',
-                                            formatter_class=RawTextHelpFormatter)
-        self.argument_parser.add_argument("file", help="File",
-                                          nargs='?', type=str)
-        self.options = self.argument_parser.parse_args()
-        QCoreApplication.setOrganizationName("QtProject")
-        QCoreApplication.setApplicationName("NoteWizard")
-        QCoreApplication.setApplicationVersion(qVersion())
+_USAGE = """usage: main.py [-h] [file]
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
+Rich Text Example
+
+positional arguments:
+  file        File
+
+options:
+  -h, --help  show this help message and exit
+"""
+
+
+def _app_module(name):
+    """Import a sibling module, installed (notewizard package) or flat
+    (python env/main.py from the source tree)."""
+    from importlib import import_module
+    if __package__:
+        return import_module(f".{name}", __package__)
+    return import_module(name)
+
+
+def _warm_caches():
+    """Import every module the app uses, then exit.
+
+    Run once after install (main.py --warm) so the .pyc files and OS
+    file caches are populated before the user's first real launch.
+    """
+    _set_qt_plugin_path()
+    _app_module("textedit")  # pulls in treemodel, treeitem and Qt
+    _app_module("_default_html")
+
+
+def parse_args(argv=None):
+    """Parse the command line without importing argparse (or PySide6):
+    the app takes a single optional positional argument, so a few lines
+    of sys.argv handling replace the whole argparse module. --help and
+    argument errors exit before Qt shared libraries are even loaded."""
+    args = sys.argv[1:] if argv is None else argv
+    file = None
+    for arg in args:
+        if arg in ('-h', '--help'):
+            print(_USAGE, end='')
+            raise SystemExit(0)
+        if arg == '--warm':  # hidden: installer-only cache warmup
+            _warm_caches()
+            raise SystemExit(0)
+        if arg.startswith('-') or file is not None:
+            print(_USAGE, file=sys.stderr, end='')
+            print(f"main.py: error: unrecognized arguments: {arg}",
+                  file=sys.stderr)
+            raise SystemExit(2)
+        file = arg
+    return file
+
+
+def _set_qt_plugin_path():
+    """Point Qt straight at the PySide6 plugin directory.
 
-    widget = SetupWidget()
-    mw = TextEdit()
+    Locating the package spec does not import PySide6, so this can run
+    before the Qt libraries load and spare QApplication its plugin-
+    directory search. Respects an existing QT_PLUGIN_PATH.
+    """
+    from importlib.util import find_spec
+    spec = find_spec("PySide6")
+    if spec is None or not spec.origin:
+        return
+    base = os.path.dirname(spec.origin)
+    # Linux/macOS wheels nest the plugins under Qt/, Windows wheels
+    # keep them at the package root.
+    for plugins in (os.path.join(base, "Qt", "plugins"),
+                    os.path.join(base, "plugins")):
+        if os.path.isdir(plugins):
+            os.environ.setdefault("QT_PLUGIN_PATH", plugins)
+            return
 
-    available_geometry = mw.screen().availableGeometry()
-    mw.resize((available_geometry.width() * 2) / 3,
-              (available_geometry.height() * 2) / 3)
-    mw.move((available_geometry.width() - mw.width()) / 2,
-            (available_geometry.height() - mw.height()) / 2)
 
-    file = widget.options.file if widget.options.file else ":/example.html"
-    if not mw.load(file):
-        mw.file_new()
+def _init_app_identity():
+    """Set the application identity in one place, only on the non-help
+    path where a QApplication actually exists."""
+    from PySide6.QtCore import QCoreApplication, qVersion
+    QCoreApplication.setOrganizationName(_ORG)
+    QCoreApplication.setApplicationName(_APP)
+    QCoreApplication.setApplicationVersion(qVersion())
 
-    mw.show()
-    sys.exit(app.exec())
\ No newline at end of file
+def main():
+    file_arg = parse_args()
+
+    # The import/construction burst below creates thousands of short-
+    # lived objects; keeping the generational collector out of it avoids
+    # pointless collection passes on the startup path.
+    import gc
+    gc.disable()
+    try:
+        # Qt is only imported once the help/error paths are behind us.
+        _set_qt_plugin_path()
+        from PySide6.QtWidgets import QApplication
+
+        app = QApplication(sys.argv)
+        _init_app_identity()
+
+        # The primary screen is known as soon as the application exists;
+        # asking the not-yet-shown window for its screen would go through a
+        # window->screen association that can still be unresolved here.
+        from PySide6.QtGui import QGuiApplication
+        available_geometry = QGuiApplication.primaryScreen().availableGeometry()
+        w, h = available_geometry.width(), available_geometry.height()
+        nw, nh = w * 2 // 3, h * 2 // 3
+
+        # Imported only once the application is up, so that argparse --help
+        # and error exits never pay for the editor module and its Qt
+        # dependencies.
+        TextEdit = _app_module("textedit").TextEdit
+
+        mw = TextEdit()
+        mw.resize(nw, nh)
+        mw.move((w - nw) // 2, (h - nh) // 2)
+
+        mw.show()
+    finally:
+        gc.enable()
+    gc.collect()
+
+    file = file_arg if file_arg else _DEFAULT_FILE
+
+    def _finish_startup():
+        # Runs from the event loop right after the first paint: build the
+        # menus/toolbars and load the document into the visible window.
+        mw.initialize()
+        # The default document is frozen into a Python module, so the
+        # common no-argument launch skips the Qt resource system entirely.
+        # For local paths a missing file is detected with one stat() call,
+        # skipping the Qt file/resource round trip load() would make.
+        if file == _DEFAULT_FILE:
+            mw.set_html_directly(_app_module("_default_html").DEFAULT_HTML)
+            loaded = True
+        elif file.startswith(':/'):
+            loaded = mw.load(file)
+        else:
+            loaded = os.path.isfile(file) and mw.load(file)
+        if not loaded:
+            mw.file_new()
+
+    from PySide6.QtCore import QTimer
+    QTimer.singleShot(0, _finish_startup)
+
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
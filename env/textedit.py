@@ -1,33 +1,186 @@
 # Copyright (C) 2022 The Qt Company Ltd.
 # SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
 
+import mmap
+import os
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtCore import (QAbstractItemModel, QCoreApplication, QDir, QFile, QFileInfo,
-                            QItemSelectionModel, QModelIndex, QMimeDatabase, QUrl, Qt, Slot)
+from PySide6.QtCore import (QAbstractItemModel, QByteArray, QCoreApplication, QDir, QFile,
+                            QFileInfo, QItemSelectionModel, QModelIndex, QMimeDatabase,
+                            QObject, QPersistentModelIndex, QRunnable,
+                            QSettings, QSignalBlocker, QThreadPool, QTimer,
+                            QUrl, Qt, Signal, Slot)
 from PySide6.QtGui import (QAction, QActionGroup, QColor, QGuiApplication,
                            QFont, QFontDatabase, QFontInfo, QIcon,
-                           QKeySequence, QPalette, QPixmap, QTextBlockFormat,
+                           QKeySequence, QPalette, QPixmap, QPixmapCache, QTextBlockFormat,
                            QTextCharFormat, QTextCursor, QTextDocumentWriter,
                            QTextFormat, QTextListFormat)
-from PySide6.QtWidgets import (QAbstractItemView, QApplication, QMainWindow, QColorDialog, 
-                               QComboBox, QDialog, QFileDialog, QFontComboBox, 
-                               QHBoxLayout, QTextEdit, QTreeView, QMessageBox, QWidget)
-from PySide6.QtPrintSupport import (QAbstractPrintDialog, QPrinter,
-                                    QPrintDialog, QPrintPreviewDialog)
-from PySide6.QtTest import QAbstractItemModelTester
-from treemodel import TreeModel
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QMainWindow, QColorDialog,
+                               QComboBox, QDialog, QFileDialog, QFontComboBox,
+                               QHBoxLayout, QPlainTextEdit, QTextEdit, QTreeView,
+                               QMessageBox, QWidget)
+try:
+    from .treemodel import TreeModel
+except ImportError:  # running flat from the source tree
+    from treemodel import TreeModel
 
 
 ABOUT = """NoteWizard aims to make the creation and organization of notes easier."""
 
 
-MIME_TYPES = ["text/html", "text/markdown", "text/plain"]
+# A tuple so call sites cannot accidentally mutate the shared list.
+MIME_TYPES = ("text/html", "text/markdown", "text/plain")
 
 
 RSRC_PATH = ":/images/mac" if sys.platform == 'darwin' else ":/images/win"
 
 
+# Plain-text files above this size are shown in a QPlainTextEdit, whose
+# block-based layout stays responsive where QTextEdit's rich-text engine
+# re-lays-out quadratically.
+PLAIN_TEXT_SIZE_THRESHOLD = 512 * 1024
+
+
+# Files above this size are read and decoded on a worker thread so the
+# event loop keeps painting while a big note comes in.
+ASYNC_LOAD_SIZE_THRESHOLD = 1024 * 1024
+
+
+# One MIME database for the process; constructing it per open repeated
+# the provider handshake for no benefit (lookups are thread-safe).
+_MIME_DB = QMimeDatabase()
+
+
+@lru_cache(maxsize=64)
+def _sniff_mime(path, mtime_ns, size, head):
+    """MIME sniff memoized on (path, mtime, size, head): re-opening an
+    unchanged file (session restore, tests) skips the database walk."""
+    return _MIME_DB.mimeTypeForFileNameAndData(path, QByteArray(head)).name()
+
+
+def _read_local_file(path):
+    """Read a local file via mmap: the decoder reads straight from the
+    page cache and the MIME sniff only sees the head. Returns
+    (size, head, text); raises OSError on I/O failure."""
+    with open(path, 'rb') as fp:
+        try:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return 0, b'', ''
+        with mm:
+            raw = mm[:]
+        # Pure-ASCII files (the common case for plain text and most
+        # HTML) take the single-copy ascii codec instead of the UTF-8
+        # state machine; isascii() is a vectorised scan in CPython.
+        if raw.isascii():
+            return len(raw), raw[:4096], raw.decode('ascii')
+        # utf-8-sig strips a leading BOM instead of leaving U+FEFF in
+        # the document, and 'replace' keeps a mislabeled file loadable
+        # rather than aborting the open with a decode error.
+        return len(raw), raw[:4096], raw.decode('utf-8-sig', 'replace')
+
+
+class _LoadWorker(QRunnable):
+    """Reads and decodes one file off the UI thread; the result comes
+    back through the signals holder and is applied on the UI thread."""
+
+    class Signals(QObject):
+        loaded = Signal(str, str, str, int)
+        failed = Signal(str)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = self.Signals()
+
+    def run(self):
+        # Deliberately broad: an exception escaping run() dies silently
+        # on the pool thread and the UI would wait forever, so every
+        # failure must surface as the failed signal.
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+            size, head, text = _read_local_file(self.path)
+            mime_type_name = _sniff_mime(self.path, mtime_ns, size, head)
+        except Exception:
+            self.signals.failed.emit(self.path)
+            return
+        self.signals.loaded.emit(self.path, mime_type_name, text, size)
+
+
+@lru_cache(maxsize=None)
+def _themed_icon(theme_name, fallback_rel):
+    """Resolve a theme icon once per (theme, path) pair.
+
+    The PNG fallback is only constructed when the theme actually misses;
+    the two-argument QIcon.fromTheme overload decodes it eagerly even
+    when the themed icon is the one used."""
+    icon = QIcon.fromTheme(theme_name)
+    if not icon.isNull():
+        return icon
+    return QIcon(RSRC_PATH + fallback_rel)
+
+
+@lru_cache(maxsize=64)
+def _icon_for_color(rgba):
+    """Swatch icon for the text-color action, keyed on the 32-bit rgba
+    value. Cursor moves through colored text otherwise re-rendered the
+    same pixmap each time."""
+    pix = QPixmap(16, 16)
+    pix.fill(QColor.fromRgba(rgba))
+    return QIcon(pix)
+
+
+@lru_cache(maxsize=1)
+def _default_tree_text():
+    """Read default.txt once; repeated window construction hits RAM."""
+    return (Path(__file__).parent / "default.txt").read_text(encoding="utf-8")
+
+
+_STANDARD_SIZES = None
+
+
+def _standard_size_items():
+    """Entries for the font-size combo, queried from Qt once per process.
+
+    QFontDatabase needs a live QApplication, so this resolves lazily on
+    first use instead of at import time.
+    """
+    global _STANDARD_SIZES
+    if _STANDARD_SIZES is None:
+        _STANDARD_SIZES = [str(s) for s in QFontDatabase.standardSizes()]
+    return _STANDARD_SIZES
+
+
+# Shortened alias: the marker dispatch below names the enum per case,
+# and the dotted form is what match/case value patterns require.
+_MARKER = QTextBlockFormat.MarkerType
+
+
+# text_style dispatch: combo index -> (list style, block marker). None
+# means the entry keeps the surrounding list's bullet style (task lists).
+_STYLE_TABLE = {
+    1: (QTextListFormat.ListDisc, QTextBlockFormat.MarkerType.NoMarker),
+    2: (QTextListFormat.ListCircle, QTextBlockFormat.MarkerType.NoMarker),
+    3: (QTextListFormat.ListSquare, QTextBlockFormat.MarkerType.NoMarker),
+    4: (None, QTextBlockFormat.MarkerType.Unchecked),
+    5: (None, QTextBlockFormat.MarkerType.Checked),
+    6: (QTextListFormat.ListDecimal, QTextBlockFormat.MarkerType.NoMarker),
+    7: (QTextListFormat.ListLowerAlpha, QTextBlockFormat.MarkerType.NoMarker),
+    8: (QTextListFormat.ListUpperAlpha, QTextBlockFormat.MarkerType.NoMarker),
+    9: (QTextListFormat.ListLowerRoman, QTextBlockFormat.MarkerType.NoMarker),
+    10: (QTextListFormat.ListUpperRoman, QTextBlockFormat.MarkerType.NoMarker),
+}
+
+
+# Reverse of _STYLE_TABLE for cursor_position_changed: a single hashed
+# lookup replaces the eight-way comparison chain run on every cursor
+# move. Task-list entries are keyed by marker, not list style.
+_LIST_STYLE_INDEX = {style: index for index, (style, _marker)
+                     in _STYLE_TABLE.items() if style is not None}
+
+
 STYLES = ["Standard", "Bullet List (Disc)", "Bullet List (Circle)",
           "Bullet List (Square)", "Task List (Unchecked)",
           "Task List (Checked)", "Ordered List (Decimal)",
@@ -36,17 +189,69 @@ STYLES = ["Standard", "Bullet List (Disc)", "Bullet List (Circle)",
           "Heading 1", "Heading 2", "Heading 3", "Heading 4", "Heading 5",
           "Heading 6"]
 
+
+# Menu/toolbar actions described as data; _build_actions loops over
+# these instead of repeating the addAction boilerplate per action.
+# Fields: attribute to store the action under (or None), theme icon
+# (or None for a text-only entry), PNG fallback, label, slot name,
+# shortcut (or None), LowPriority flag, add-to-toolbar flag. A bare
+# _SEP entry inserts a menu separator.
+_SEP = "---"
+
+_FILE_ACTIONS = (
+    (None, QIcon.ThemeIcon.DocumentNew, "/filenew.png", "&New",
+     "file_new", QKeySequence.New, True, True),
+    (None, QIcon.ThemeIcon.DocumentOpen, "/fileopen.png", "&Open...",
+     "file_open", QKeySequence.Open, False, True),
+    _SEP,
+    ("_action_save", QIcon.ThemeIcon.DocumentSave, "/filesave.png", "&Save",
+     "file_save", QKeySequence.Save, False, True),
+    (None, None, None, "Save &As...", "file_save_as", None, True, False),
+    _SEP,
+    (None, QIcon.ThemeIcon.DocumentPrint, "/fileprint.png", "&Print...",
+     "file_print", QKeySequence.Print, True, True),
+    (None, "fileprint", "/fileprint.png", "Print Preview...",
+     "file_print_preview", None, False, False),
+    (None, "exportpdf", "/exportpdf.png", "&Export PDF...",
+     "file_print_pdf", Qt.CTRL | Qt.Key_D, True, True),
+    _SEP,
+    (None, None, None, "&Quit", "close", Qt.CTRL | Qt.Key_Q, False, False),
+)
+
+_EDIT_ACTIONS = (
+    ("_action_undo", QIcon.ThemeIcon.EditUndo, "/editundo.png", "&Undo",
+     "_edit_undo", QKeySequence.Undo, False, True),
+    ("_action_redo", QIcon.ThemeIcon.EditRedo, "/editredo.png", "&Redo",
+     "_edit_redo", QKeySequence.Redo, True, True),
+    _SEP,
+    ("_action_cut", QIcon.ThemeIcon.EditCut, "/editcut.png", "Cu&t",
+     "_edit_cut", QKeySequence.Cut, True, True),
+    ("_action_copy", QIcon.ThemeIcon.EditCopy, "/editcopy.png", "&Copy",
+     "_edit_copy", QKeySequence.Copy, True, True),
+    ("_action_paste", QIcon.ThemeIcon.EditPaste, "/editpaste.png", "&Paste",
+     "_edit_paste", QKeySequence.Paste, True, True),
+)
+
+
 class TextEdit(QMainWindow):
+    # Resolved once: the nested enum attribute walk otherwise repeats
+    # on every insert_child call.
+    _CLEAR_AND_SELECT = QItemSelectionModel.ClearAndSelect
+
     def __init__(self, parent=None):
         super().__init__(parent)
         if sys.platform == 'darwin':
             self.setUnifiedTitleAndToolBarOnMac(True)
         self.setWindowTitle(QCoreApplication.applicationName())
         self.setWindowTitle("NoteWizard")
+        self._initialized = False
+        self._ui_silenced = False
+        self._title_update_pending = False
+        self._update_pending = False
+        self._last_status = ""
+        self._printer = None
 
-        self._text_edit = QTextEdit(self)
-        self._text_edit.currentCharFormatChanged.connect(self.current_char_format_changed)
-        self._text_edit.cursorPositionChanged.connect(self.cursor_position_changed)
+        self._text_edit = self._make_editor()
 
         # Code pertaining to the file/folder tree structure below
         self.view = QTreeView()
@@ -58,19 +263,18 @@ class TextEdit(QMainWindow):
 
         headers = ["Notes"]
 
-        file = Path(__file__).parent / "default.txt"
-        self.model = TreeModel(headers, file.read_text(), self)
+        self.model = TreeModel(headers, _default_tree_text(), self)
 
         if "-t" in sys.argv:
+            # QtTest is a developer-only dependency; keep it off the
+            # normal startup import path.
+            from PySide6.QtTest import QAbstractItemModelTester
             QAbstractItemModelTester(self.model, self)
         self.view.setModel(self.model)
-        self.view.expandAll()
-
-        for column in range(self.model.columnCount()):
-            self.view.resizeColumnToContents(column)
-
-        selection_model = self.view.selectionModel()
-        selection_model.selectionChanged.connect(self.update_actions)
+        self._columns_sized = False
+        # Restore from the event loop: setExpanded before the view has
+        # laid itself out would force an early full layout pass.
+        QTimer.singleShot(0, self._restore_expansion)
 
         self.main_layout = QHBoxLayout()
         self.main_layout.addWidget(self.view, 1)
@@ -79,6 +283,38 @@ class TextEdit(QMainWindow):
         self.layout_widget.setLayout(self.main_layout)
         self.setCentralWidget(self.layout_widget)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Content-based column sizing walks every row; do it once, from
+        # the event loop after the first show, instead of in __init__
+        # where it delays the window appearing at all.
+        if not self._columns_sized:
+            self._columns_sized = True
+            QTimer.singleShot(0, self._size_columns)
+
+    @Slot()
+    def _size_columns(self):
+        for column in range(self.model.columnCount()):
+            self.view.resizeColumnToContents(column)
+
+    def initialize(self):
+        """Finish construction: menus, toolbars, fonts and signal wiring.
+
+        Kept out of __init__ so the bare window can be shown first and the
+        heavy setup runs from the event loop (QTimer.singleShot(0, ...)),
+        reducing the time to first paint.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+
+        selection_model = self.view.selectionModel()
+        selection_model.selectionChanged.connect(self.update_actions)
+
+        # Room for the icon resolutions QIcon renders from the cached
+        # entries above, so they survive across toolbars and menus.
+        QPixmapCache.setCacheLimit(10240)
+
         self.setToolButtonStyle(Qt.ToolButtonFollowStyle)
         self.setup_file_actions()
         self.setup_edit_actions()
@@ -99,21 +335,22 @@ class TextEdit(QMainWindow):
         self.color_changed(self._text_edit.textColor())
         self.alignment_changed(self._text_edit.alignment())
         
+        self._wire_editor(self._text_edit)
         document = self._text_edit.document()
-        document.modificationChanged.connect(self._action_save.setEnabled)
-        document.modificationChanged.connect(self.setWindowModified)
-        document.undoAvailable.connect(self._action_undo.setEnabled)
-        document.redoAvailable.connect(self._action_redo.setEnabled)
         self.setWindowModified(document.isModified())
         self._action_save.setEnabled(document.isModified())
         self._action_undo.setEnabled(document.isUndoAvailable())
         self._action_redo.setEnabled(document.isRedoAvailable())
-
         self._action_cut.setEnabled(False)
-        self._text_edit.copyAvailable.connect(self._action_cut.setEnabled)
         self._action_copy.setEnabled(False)
-        self._text_edit.copyAvailable.connect(self._action_copy.setEnabled)
 
+        # Clipboard-heavy applications emit dataChanged in bursts; the
+        # timer folds a burst into one mimeData() round trip (which can
+        # block on the selection owner under X11).
+        self._clip_timer = QTimer(self)
+        self._clip_timer.setSingleShot(True)
+        self._clip_timer.setInterval(50)
+        self._clip_timer.timeout.connect(self._check_clipboard)
         QGuiApplication.clipboard().dataChanged.connect(self.clipboard_data_changed)
 
         self._text_edit.setFocus()
@@ -126,101 +363,162 @@ class TextEdit(QMainWindow):
             pal.setColor(QPalette.Text, QColor(Qt.black))
             self._text_edit.setPalette(pal)
 
-    def closeEvent(self, e):
-        if self.maybe_save():
-            e.accept()
-        else:
-            e.ignore()
-
-    def setup_file_actions(self):
-        tb = self.addToolBar("File self.actions")
-        menu = self.menuBar().addMenu("&File")
+    @staticmethod
+    def _editor_class_for(mime_type, size):
+        """Large plain-text documents get a QPlainTextEdit; everything
+        else (and the initial empty document) keeps the rich QTextEdit."""
+        if mime_type == "text/plain" and size > PLAIN_TEXT_SIZE_THRESHOLD:
+            return QPlainTextEdit
+        return QTextEdit
+
+    def _make_editor(self, mime_type=None, size=0):
+        return self._editor_class_for(mime_type, size)(self)
+
+    def _wire_editor(self, editor):
+        """Connect editor and document signals to the window's actions."""
+        if isinstance(editor, QTextEdit):
+            editor.currentCharFormatChanged.connect(self.current_char_format_changed)
+        editor.cursorPositionChanged.connect(self.cursor_position_changed)
+        editor.copyAvailable.connect(self._on_copy_available)
+
+        document = editor.document()
+        document.modificationChanged.connect(self._on_modified)
+        document.undoAvailable.connect(self._action_undo.setEnabled)
+        document.redoAvailable.connect(self._action_redo.setEnabled)
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.DocumentNew,
-                               QIcon(RSRC_PATH + "/filenew.png"))
-        a = menu.addAction(icon, "&New", self.file_new)
-        tb.addAction(a)
-        a.setPriority(QAction.LowPriority)
-        a.setShortcut(QKeySequence.New)
+    # One dispatch per emission instead of two: these signals fire on
+    # every document modification / selection change while typing.
+    @Slot(bool)
+    def _on_modified(self, modified):
+        self._action_save.setEnabled(modified)
+        self.setWindowModified(modified)
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.DocumentOpen,
-                               QIcon(RSRC_PATH + "/fileopen.png"))
-        a = menu.addAction(icon, "&Open...", self.file_open)
-        a.setShortcut(QKeySequence.Open)
-        tb.addAction(a)
+    @Slot(bool)
+    def _on_copy_available(self, available):
+        self._action_cut.setEnabled(available)
+        self._action_copy.setEnabled(available)
+
+    def _replace_editor(self, editor):
+        """Swap the central editor widget, carrying over font settings."""
+        old = self._text_edit
+        editor.setFont(old.font())
+        editor.setTabStopDistance(old.tabStopDistance())
+        self.main_layout.replaceWidget(old, editor)
+        self._text_edit = editor
+        if self._initialized:
+            self._wire_editor(editor)
+        old.deleteLater()
+        editor.setFocus()
+
+    @contextmanager
+    def _suppress_ui(self):
+        """Silence the per-edit UI sync slots for the duration of a bulk
+        edit, then re-synchronize once instead of per micro-edit."""
+        self._ui_silenced = True
+        try:
+            yield
+        finally:
+            self._ui_silenced = False
+            if self._initialized:
+                self.current_char_format_changed(
+                    self._text_edit.currentCharFormat())
+                self.cursor_position_changed()
+
+    # The edit actions go through these forwarders rather than binding the
+    # editor's methods directly, so they keep working after an editor swap.
+    @Slot()
+    def _edit_undo(self):
+        self._text_edit.undo()
 
-        menu.addSeparator()
+    @Slot()
+    def _edit_redo(self):
+        self._text_edit.redo()
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.DocumentSave,
-                               QIcon(RSRC_PATH + "/filesave.png"))
-        self._action_save = menu.addAction(icon, "&Save", self.file_save)
-        self._action_save.setShortcut(QKeySequence.Save)
-        self._action_save.setEnabled(False)
-        tb.addAction(self._action_save)
+    @Slot()
+    def _edit_cut(self):
+        self._text_edit.cut()
 
-        a = menu.addAction("Save &As...", self.file_save_as)
-        a.setPriority(QAction.LowPriority)
-        menu.addSeparator()
+    @Slot()
+    def _edit_copy(self):
+        self._text_edit.copy()
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.DocumentPrint,
-                               QIcon(RSRC_PATH + "/fileprint.png"))
-        a = menu.addAction(icon, "&Print...", self.file_print)
-        a.setPriority(QAction.LowPriority)
-        a.setShortcut(QKeySequence.Print)
-        tb.addAction(a)
+    @Slot()
+    def _edit_paste(self):
+        self._text_edit.paste()
 
-        icon = QIcon.fromTheme("fileprint", QIcon(RSRC_PATH + "/fileprint.png"))
-        menu.addAction(icon, "Print Preview...", self.file_print_preview)
+    def closeEvent(self, e):
+        if self.maybe_save():
+            self._save_expansion()
+            e.accept()
+        else:
+            e.ignore()
 
-        icon = QIcon.fromTheme("exportpdf", QIcon(RSRC_PATH + "/exportpdf.png"))
-        a = menu.addAction(icon, "&Export PDF...", self.file_print_pdf)
-        a.setPriority(QAction.LowPriority)
-        a.setShortcut(Qt.CTRL | Qt.Key_D)
-        tb.addAction(a)
+    # Expanded nodes are remembered across sessions as row paths
+    # ("0/2/1"), so the tree can start collapsed (no full layout on
+    # startup) without losing the user's working set.
+    _EXPANSION_KEY = "tree/expandedPaths"
+
+    def _save_expansion(self):
+        paths = []
+        self._collect_expanded(QModelIndex(), "", paths)
+        QSettings().setValue(self._EXPANSION_KEY, paths)
+
+    def _collect_expanded(self, parent, prefix, paths):
+        model = self.model
+        for row in range(model.rowCount(parent)):
+            index = model.index(row, 0, parent)
+            if self.view.isExpanded(index):
+                path = f"{prefix}{row}"
+                paths.append(path)
+                self._collect_expanded(index, path + "/", paths)
 
-        menu.addSeparator()
+    @Slot()
+    def _restore_expansion(self):
+        paths = QSettings().value(self._EXPANSION_KEY) or []
+        if isinstance(paths, str):  # QSettings flattens single-item lists
+            paths = [paths]
+        model = self.model
+        for path in paths:
+            index = QModelIndex()
+            for row in path.split("/"):
+                index = model.index(int(row), 0, index)
+                if not index.isValid():
+                    break
+            else:
+                self.view.setExpanded(index, True)
+
+    def _build_actions(self, menu, tb, specs):
+        """Instantiate one of the module-level action tables into a menu
+        and toolbar."""
+        for spec in specs:
+            if spec == _SEP:
+                menu.addSeparator()
+                continue
+            attr, theme, fallback, label, slot_name, shortcut, low, on_tb = spec
+            slot = getattr(self, slot_name)
+            if theme is not None:
+                a = menu.addAction(_themed_icon(theme, fallback), label, slot)
+            else:
+                a = menu.addAction(label, slot)
+            if shortcut is not None:
+                a.setShortcut(shortcut)
+            if low:
+                a.setPriority(QAction.LowPriority)
+            if on_tb:
+                tb.addAction(a)
+            if attr:
+                setattr(self, attr, a)
 
-        a = menu.addAction("&Quit", self.close)
-        a.setShortcut(Qt.CTRL | Qt.Key_Q)
+    def setup_file_actions(self):
+        tb = self.addToolBar("File self.actions")
+        menu = self.menuBar().addMenu("&File")
+        self._build_actions(menu, tb, _FILE_ACTIONS)
+        self._action_save.setEnabled(False)
 
     def setup_edit_actions(self):
         tb = self.addToolBar("Edit self.actions")
         menu = self.menuBar().addMenu("&Edit")
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.EditUndo,
-                               QIcon(RSRC_PATH + "/editundo.png"))
-        self._action_undo = menu.addAction(icon, "&Undo", self._text_edit.undo)
-        self._action_undo.setShortcut(QKeySequence.Undo)
-        tb.addAction(self._action_undo)
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.EditRedo,
-                               QIcon(RSRC_PATH + "/editredo.png"))
-        self._action_redo = menu.addAction(icon, "&Redo", self._text_edit.redo)
-        self._action_redo.setPriority(QAction.LowPriority)
-        self._action_redo.setShortcut(QKeySequence.Redo)
-        tb.addAction(self._action_redo)
-        menu.addSeparator()
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.EditCut,
-                               QIcon(RSRC_PATH + "/editcut.png"))
-        self._action_cut = menu.addAction(icon, "Cu&t", self._text_edit.cut)
-        self._action_cut.setPriority(QAction.LowPriority)
-        self._action_cut.setShortcut(QKeySequence.Cut)
-        tb.addAction(self._action_cut)
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.EditCopy,
-                               QIcon(RSRC_PATH + "/editcopy.png"))
-        self._action_copy = menu.addAction(icon, "&Copy", self._text_edit.copy)
-        self._action_copy.setPriority(QAction.LowPriority)
-        self._action_copy.setShortcut(QKeySequence.Copy)
-        tb.addAction(self._action_copy)
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.EditPaste,
-                               QIcon(RSRC_PATH + "/editpaste.png"))
-        self._action_paste = menu.addAction(icon, "&Paste", self._text_edit.paste)
-        self._action_paste.setPriority(QAction.LowPriority)
-        self._action_paste.setShortcut(QKeySequence.Paste)
-        tb.addAction(self._action_paste)
+        self._build_actions(menu, tb, _EDIT_ACTIONS)
 
         md = QGuiApplication.clipboard().mimeData()
         if md:
@@ -230,78 +528,71 @@ class TextEdit(QMainWindow):
         tb = self.addToolBar("Format self.actions")
         menu = self.menuBar().addMenu("F&ormat")
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatTextBold,
-                               QIcon(RSRC_PATH + "/textbold.png"))
-        self._action_text_bold = menu.addAction(icon, "&Bold", self.text_bold)
-        self._action_text_bold.setShortcut(Qt.CTRL | Qt.Key_B)
-        self._action_text_bold.setPriority(QAction.LowPriority)
-        bold = QFont()
-        bold.setBold(True)
-        self._action_text_bold.setFont(bold)
-        tb.addAction(self._action_text_bold)
-        self._action_text_bold.setCheckable(True)
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatTextItalic,
-                               QIcon(RSRC_PATH + "/textitalic.png"))
-        self._action_text_italic = menu.addAction(icon, "&Italic", self.text_italic)
-        self._action_text_italic.setPriority(QAction.LowPriority)
-        self._action_text_italic.setShortcut(Qt.CTRL | Qt.Key_I)
-        italic = QFont()
-        italic.setItalic(True)
-        self._action_text_italic.setFont(italic)
-        tb.addAction(self._action_text_italic)
-        self._action_text_italic.setCheckable(True)
-
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatTextUnderline,
-                               QIcon(RSRC_PATH + "/textunder.png"))
-        self._action_text_underline = menu.addAction(icon, "&Underline",
-                                                     self.text_underline)
-        self._action_text_underline.setShortcut(Qt.CTRL | Qt.Key_U)
-        self._action_text_underline.setPriority(QAction.LowPriority)
-        underline = QFont()
-        underline.setUnderline(True)
-        self._action_text_underline.setFont(underline)
-        tb.addAction(self._action_text_underline)
-        self._action_text_underline.setCheckable(True)
+        # The checkable character-format trio differs only in icon,
+        # shortcut and which QFont styler previews the effect.
+        for attr, theme, fallback, label, slot_name, shortcut, styler in (
+            ("_action_text_bold", QIcon.ThemeIcon.FormatTextBold,
+             "/textbold.png", "&Bold", "text_bold",
+             Qt.CTRL | Qt.Key_B, QFont.setBold),
+            ("_action_text_italic", QIcon.ThemeIcon.FormatTextItalic,
+             "/textitalic.png", "&Italic", "text_italic",
+             Qt.CTRL | Qt.Key_I, QFont.setItalic),
+            ("_action_text_underline", QIcon.ThemeIcon.FormatTextUnderline,
+             "/textunder.png", "&Underline", "text_underline",
+             Qt.CTRL | Qt.Key_U, QFont.setUnderline),
+        ):
+            icon = _themed_icon(theme, fallback)
+            a = menu.addAction(icon, label, getattr(self, slot_name))
+            a.setShortcut(shortcut)
+            a.setPriority(QAction.LowPriority)
+            preview = QFont()
+            styler(preview, True)
+            a.setFont(preview)
+            a.setCheckable(True)
+            tb.addAction(a)
+            setattr(self, attr, a)
 
         menu.addSeparator()
 
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatJustifyLeft,
-                               QIcon(RSRC_PATH + "/textleft.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatJustifyLeft, "/textleft.png")
         self._action_align_left = QAction(icon, "&Left", self)
         self._action_align_left.setShortcut(Qt.CTRL | Qt.Key_L)
         self._action_align_left.setCheckable(True)
         self._action_align_left.setPriority(QAction.LowPriority)
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatJustifyCenter,
-                               QIcon(RSRC_PATH + "/textcenter.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatJustifyCenter, "/textcenter.png")
         self._action_align_center = QAction(icon, "C&enter", self)
         self._action_align_center.setShortcut(Qt.CTRL | Qt.Key_E)
         self._action_align_center.setCheckable(True)
         self._action_align_center.setPriority(QAction.LowPriority)
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatJustifyRight,
-                               QIcon(RSRC_PATH + "/textright.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatJustifyRight, "/textright.png")
         self._action_align_right = QAction(icon, "&Right", self)
         self._action_align_right.setShortcut(Qt.CTRL | Qt.Key_R)
         self._action_align_right.setCheckable(True)
         self._action_align_right.setPriority(QAction.LowPriority)
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatJustifyFill,
-                               QIcon(RSRC_PATH + "/textjustify.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatJustifyFill, "/textjustify.png")
         self._action_align_justify = QAction(icon, "&Justify", self)
         self._action_align_justify.setShortcut(Qt.CTRL | Qt.Key_J)
         self._action_align_justify.setCheckable(True)
         self._action_align_justify.setPriority(QAction.LowPriority)
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatIndentMore,
-                               QIcon(RSRC_PATH + "/format-indent-more.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatIndentMore, "/format-indent-more.png")
         self._action_indent_more = menu.addAction(icon, "&Indent", self.indent)
         self._action_indent_more.setShortcut(Qt.CTRL | Qt.Key_BracketRight)
         self._action_indent_more.setPriority(QAction.LowPriority)
-        icon = QIcon.fromTheme(QIcon.ThemeIcon.FormatIndentLess,
-                               QIcon(RSRC_PATH + "/format-indent-less.png"))
+        icon = _themed_icon(QIcon.ThemeIcon.FormatIndentLess, "/format-indent-less.png")
         self._action_indent_less = menu.addAction(icon, "&Unindent",
                                                   self.unindent)
         self._action_indent_less.setShortcut(Qt.CTRL | Qt.Key_BracketLeft)
         self._action_indent_less.setPriority(QAction.LowPriority)
 
+        # Alignment flag -> action, for the dict lookup in
+        # alignment_changed.
+        self._align_map = {
+            int(Qt.AlignLeft): self._action_align_left,
+            int(Qt.AlignHCenter): self._action_align_center,
+            int(Qt.AlignRight): self._action_align_right,
+            int(Qt.AlignJustify): self._action_align_justify,
+        }
+
         # Make sure the alignLeft is always left of the alignRight
         align_group = QActionGroup(self)
         align_group.triggered.connect(self.text_align)
@@ -337,8 +628,7 @@ class TextEdit(QMainWindow):
 
         menu.addSeparator()
 
-        icon = QIcon.fromTheme("status-checkbox-checked",
-                               QIcon(RSRC_PATH + "/checkbox-checked.png"))
+        icon = _themed_icon("status-checkbox-checked", "/checkbox-checked.png")
         self._action_toggle_check_state = menu.addAction(icon, "Chec&ked")
         self._action_toggle_check_state.toggled.connect(self.set_checked)
         self._action_toggle_check_state.setShortcut(Qt.CTRL | Qt.Key_K)
@@ -366,10 +656,9 @@ class TextEdit(QMainWindow):
         tb.addWidget(self._combo_size)
         self._combo_size.setEditable(True)
 
-        standard_sizes = QFontDatabase.standardSizes()
-        for size in standard_sizes:
-            self._combo_size.addItem(str(size))
-        index = standard_sizes.index(QApplication.font().pointSize())
+        standard_sizes = _standard_size_items()
+        self._combo_size.addItems(standard_sizes)
+        index = standard_sizes.index(str(QApplication.font().pointSize()))
         self._combo_size.setCurrentIndex(index)
 
         self._combo_size.textActivated.connect(self.text_size)
@@ -399,26 +688,88 @@ class TextEdit(QMainWindow):
     def load(self, f):
         if not QFile.exists(f):
             return False
-        file = QFile(f)
-        if not file.open(QFile.ReadOnly):
-            return False
 
-        data = file.readAll()
-        db = QMimeDatabase()
-        mime_type_name = db.mimeTypeForFileNameAndData(f, data).name()
-        text = data.data().decode('utf8')
-        if mime_type_name == "text/html":
-            file_url = QUrl(f) if f[0] == ':' else QUrl.fromLocalFile(f)
-            options = QUrl.FormattingOptions(QUrl.RemoveFilename)
-            self._text_edit.document().setBaseUrl(file_url.adjusted(options))
-            self._text_edit.setHtml(text)
-        elif mime_type_name == "text/markdown":
-            self._text_edit.setMarkdown(text)
+        if f.startswith(':/'):
+            # Resource paths only resolve through the Qt file layer.
+            file = QFile(f)
+            if not file.open(QFile.ReadOnly):
+                return False
+            data = file.readAll()
+            size = data.size()
+            mime_type_name = _MIME_DB.mimeTypeForFileNameAndData(f, data).name()
+            text = data.data().decode('utf8')
         else:
-            self._text_edit.setPlainText(text)
+            try:
+                st = os.stat(f)
+                if st.st_size > ASYNC_LOAD_SIZE_THRESHOLD:
+                    # Large file: read and decode on a pool thread and
+                    # apply the content once it arrives.
+                    worker = _LoadWorker(f)
+                    worker.signals.loaded.connect(self._apply_loaded_content)
+                    worker.signals.failed.connect(self._async_load_failed)
+                    QThreadPool.globalInstance().start(worker)
+                    return True
+                size, head, text = _read_local_file(f)
+            except OSError:
+                return False
+            mime_type_name = _sniff_mime(f, st.st_mtime_ns, size, head)
+
+        self._set_document_content(f, mime_type_name, text, size)
+        return True
+
+    @Slot(str, str, str, int)
+    def _apply_loaded_content(self, f, mime_type_name, text, size):
+        self._set_document_content(f, mime_type_name, text, size)
+
+    def _show_status(self, msg):
+        """Single funnel for status-bar messages: keeps the duplicate-
+        suppression cache in update_actions in sync with whatever was
+        last shown."""
+        self._last_status = msg
+        self.statusBar().showMessage(msg)
+
+    @Slot(str)
+    def _async_load_failed(self, f):
+        native_fn = QDir.toNativeSeparators(f)
+        self._show_status(f'Could not open "{native_fn}"')
+
+    def _set_document_content(self, f, mime_type_name, text, size):
+        editor_class = self._editor_class_for(mime_type_name, size)
+        if editor_class is not type(self._text_edit):
+            self._replace_editor(editor_class(self))
+
+        # Suspend document layout while the content streams in, so the
+        # engine does one layout pass at the end instead of laying out
+        # every intermediate state.
+        document = self._text_edit.document()
+        document.setLayoutEnabled(False)
+        try:
+            if mime_type_name == "text/html":
+                file_url = QUrl(f) if f.startswith(':/') else QUrl.fromLocalFile(f)
+                options = QUrl.FormattingOptions(QUrl.RemoveFilename)
+                document.setBaseUrl(file_url.adjusted(options))
+                self._text_edit.setHtml(text)
+            elif mime_type_name == "text/markdown":
+                self._text_edit.setMarkdown(text)
+            else:
+                self._text_edit.setPlainText(text)
+        finally:
+            document.setLayoutEnabled(True)
 
         self.set_current_file_name(f)
-        return True
+
+    def set_html_directly(self, html):
+        """Set document content from an in-memory HTML blob, skipping the
+        file/resource round trip load() would make."""
+        if isinstance(html, (bytes, bytearray)):
+            html = html.decode('utf8')
+        document = self._text_edit.document()
+        document.setLayoutEnabled(False)
+        try:
+            self._text_edit.setHtml(html)
+        finally:
+            document.setLayoutEnabled(True)
+        self.set_current_file_name('')
 
     def maybe_save(self):
         if not self._text_edit.document().isModified():
@@ -437,9 +788,23 @@ class TextEdit(QMainWindow):
 
     def set_current_file_name(self, fileName):
         self._file_name = fileName
-        self._text_edit.document().setModified(False)
+        document = self._text_edit.document()
+        # Already-clean documents (file_new after clear()) would otherwise
+        # fire the whole modificationChanged slot chain for nothing.
+        if document.isModified():
+            document.setModified(False)
+
+        # Consecutive calls (e.g. save-as followed by file_save) coalesce
+        # into one title update on the next event-loop turn.
+        if not self._title_update_pending:
+            self._title_update_pending = True
+            QTimer.singleShot(0, self._update_window_title)
 
-        shown_name = QFileInfo(fileName).fileName() if fileName else "untitled.txt"
+    @Slot()
+    def _update_window_title(self):
+        self._title_update_pending = False
+        file_name = self._file_name
+        shown_name = QFileInfo(file_name).fileName() if file_name else "untitled.txt"
         app_name = QCoreApplication.applicationName()
         self.setWindowTitle(f"{shown_name}[*] - {app_name}")
         self.setWindowModified(False)
@@ -461,9 +826,9 @@ class TextEdit(QMainWindow):
         fn = file_dialog.selectedFiles()[0]
         native_fn = QDir.toNativeSeparators(fn)
         if self.load(fn):
-            self.statusBar().showMessage(f'Opened "{native_fn}"')
+            self._show_status(f'Opened "{native_fn}"')
         else:
-            self.statusBar().showMessage(f'Could not open "{native_fn}"')
+            self._show_status(f'Could not open "{native_fn}"')
 
     @Slot()
     def file_save(self):
@@ -476,9 +841,9 @@ class TextEdit(QMainWindow):
         native_fn = QDir.toNativeSeparators(self._file_name)
         if success:
             document.setModified(False)
-            self.statusBar().showMessage(f'Wrote "{native_fn}"')
+            self._show_status(f'Wrote "{native_fn}"')
         else:
-            self.statusBar().showMessage(f'Could not write to file "{native_fn}"')
+            self._show_status(f'Could not write to file "{native_fn}"')
         return success
 
     @Slot()
@@ -486,8 +851,8 @@ class TextEdit(QMainWindow):
         file_dialog = QFileDialog(self, "Save as...")
         file_dialog.setAcceptMode(QFileDialog.AcceptSave)
 
-        mime_types = MIME_TYPES
-        mime_types.insert(1, "application/vnd.oasis.opendocument.text")
+        mime_types = [MIME_TYPES[0], "application/vnd.oasis.opendocument.text",
+                      *MIME_TYPES[1:]]
         file_dialog.setMimeTypeFilters(mime_types)
         file_dialog.setDefaultSuffix("odt")
         if file_dialog.exec() != QDialog.Accepted:
@@ -496,9 +861,20 @@ class TextEdit(QMainWindow):
         self.set_current_file_name(fn)
         return self.file_save()
 
+    def _get_printer(self):
+        # Constructed once: the first QPrinter enumerates the system's
+        # printers, which is not worth repeating per print action. The
+        # QtPrintSupport library itself is only loaded here, on first
+        # use, instead of at module import.
+        if self._printer is None:
+            from PySide6.QtPrintSupport import QPrinter
+            self._printer = QPrinter(QPrinter.HighResolution)
+        return self._printer
+
     @Slot()
     def file_print(self):
-        printer = QPrinter(QPrinter.HighResolution)
+        from PySide6.QtPrintSupport import QAbstractPrintDialog, QPrintDialog
+        printer = self._get_printer()
         dlg = QPrintDialog(printer, self)
         if self._text_edit.textCursor().hasSelection():
             dlg.setOption(QAbstractPrintDialog.PrintSelection)
@@ -508,7 +884,8 @@ class TextEdit(QMainWindow):
 
     @Slot()
     def file_print_preview(self):
-        printer = QPrinter(QPrinter.HighResolution)
+        from PySide6.QtPrintSupport import QPrintPreviewDialog
+        printer = self._get_printer()
         preview = QPrintPreviewDialog(printer, self)
         preview.paintRequested.connect(self._text_edit.print_)
         preview.exec()
@@ -522,17 +899,35 @@ class TextEdit(QMainWindow):
         if file_dialog.exec() != QDialog.Accepted:
             return
         pdf_file_name = file_dialog.selectedFiles()[0]
-        printer = QPrinter(QPrinter.HighResolution)
+        from PySide6.QtPrintSupport import QPrinter
+        printer = self._get_printer()
         printer.setOutputFormat(QPrinter.PdfFormat)
         printer.setOutputFileName(pdf_file_name)
         self._text_edit.document().print_(printer)
+        # Put the shared printer back into its paper-printing state.
+        printer.setOutputFileName('')
+        printer.setOutputFormat(QPrinter.NativeFormat)
         native_fn = QDir.toNativeSeparators(pdf_file_name)
-        self.statusBar().showMessage(f'Exported "{native_fn}"')
+        self._show_status(f'Exported "{native_fn}"')
+
+    def _set_char_prop(self, prop_id, value):
+        """Apply a single character-format property to the word or
+        selection. A fresh one-property format per call keeps the merge
+        minimal; Qt merges only the properties actually set.
+
+        Only for properties whose typed setter stores the raw value:
+        weight and underline go through their QTextCharFormat setters
+        in the slots below, since setProperty would store an enum-typed
+        weight (breaking HTML export) and FontUnderline is not the
+        property HTML import writes underlines to."""
+        fmt = QTextCharFormat()
+        fmt.setProperty(prop_id, value)
+        self.merge_format_on_word_or_selection(fmt)
 
     @Slot()
     def text_bold(self):
-        fmt = QTextCharFormat()
         weight = QFont.Bold if self._action_text_bold.isChecked() else QFont.Normal
+        fmt = QTextCharFormat()
         fmt.setFontWeight(weight)
         self.merge_format_on_word_or_selection(fmt)
 
@@ -544,95 +939,71 @@ class TextEdit(QMainWindow):
 
     @Slot()
     def text_italic(self):
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(self._action_text_italic.isChecked())
-        self.merge_format_on_word_or_selection(fmt)
+        self._set_char_prop(QTextFormat.FontItalic,
+                            self._action_text_italic.isChecked())
 
     @Slot(str)
     def text_family(self, f):
-        fmt = QTextCharFormat()
-        fmt.setFontFamilies({f})
-        self.merge_format_on_word_or_selection(fmt)
+        self._set_char_prop(QTextFormat.FontFamilies, [f])
 
     @Slot(str)
     def text_size(self, p):
         point_size = float(p)
         if point_size > 0:
-            fmt = QTextCharFormat()
-            fmt.setFontPointSize(point_size)
-            self.merge_format_on_word_or_selection(fmt)
+            self._set_char_prop(QTextFormat.FontPointSize, point_size)
 
     @Slot(int)
     def text_style(self, styleIndex):
         cursor = self._text_edit.textCursor()
-        style = QTextListFormat.ListStyleUndefined
-        marker = QTextBlockFormat.MarkerType.NoMarker
-
-        if styleIndex == 1:
-            style = QTextListFormat.ListDisc
-        elif styleIndex == 2:
-            style = QTextListFormat.ListCircle
-        elif styleIndex == 3:
-            style = QTextListFormat.ListSquare
-        elif styleIndex == 4:
-            if cursor.currentList():
-                style = cursor.currentList().format().style()
-            else:
-                style = QTextListFormat.ListDisc
-            marker = QTextBlockFormat.MarkerType.Unchecked
-        elif styleIndex == 5:
-            if cursor.currentList():
-                style = cursor.currentList().format().style()
-            else:
-                style = QTextListFormat.ListDisc
-            marker = QTextBlockFormat.MarkerType.Checked
-        elif styleIndex == 6:
-            style = QTextListFormat.ListDecimal
-        elif styleIndex == 7:
-            style = QTextListFormat.ListLowerAlpha
-        elif styleIndex == 8:
-            style = QTextListFormat.ListUpperAlpha
-        elif styleIndex == 9:
-            style = QTextListFormat.ListLowerRoman
-        elif styleIndex == 10:
-            style = QTextListFormat.ListUpperRoman
+        style, marker = _STYLE_TABLE.get(
+            styleIndex, (QTextListFormat.ListStyleUndefined,
+                         QTextBlockFormat.MarkerType.NoMarker))
+        if style is None:
+            current_list = cursor.currentList()
+            style = (current_list.format().style() if current_list
+                     else QTextListFormat.ListDisc)
 
-        cursor.beginEditBlock()
+        with self._suppress_ui():
+            cursor.beginEditBlock()
 
-        block_fmt = cursor.blockFormat()
+            block_fmt = cursor.blockFormat()
 
-        if style == QTextListFormat.ListStyleUndefined:
-            block_fmt.setObjectIndex(-1)
-            # H1 to H6, or Standard
-            heading_level = styleIndex - 11 + 1 if styleIndex >= 11 else 0
-            block_fmt.setHeadingLevel(heading_level)
-            cursor.setBlockFormat(block_fmt)
+            if style == QTextListFormat.ListStyleUndefined:
+                block_fmt.setObjectIndex(-1)
+                # H1 to H6, or Standard
+                heading_level = styleIndex - 11 + 1 if styleIndex >= 11 else 0
+                block_fmt.setHeadingLevel(heading_level)
+                cursor.setBlockFormat(block_fmt)
 
-            # H1 to H6: +3 to -2
-            size_adjustment = 4 - heading_level if heading_level != 0 else 0
-            fmt = QTextCharFormat()
-            fmt.setFontWeight(QFont.Bold if heading_level else QFont.Normal)
-            fmt.setProperty(QTextFormat.FontSizeAdjustment, size_adjustment)
-            cursor.select(QTextCursor.LineUnderCursor)
-            cursor.mergeCharFormat(fmt)
-            self._text_edit.mergeCurrentCharFormat(fmt)
-        else:
-            block_fmt.setMarker(marker)
-            cursor.setBlockFormat(block_fmt)
-            list_fmt = QTextListFormat()
-            if cursor.currentList():
-                list_fmt = cursor.currentList().format()
+                # H1 to H6: +3 to -2
+                size_adjustment = 4 - heading_level if heading_level != 0 else 0
+                fmt = QTextCharFormat()
+                fmt.setFontWeight(QFont.Bold if heading_level else QFont.Normal)
+                fmt.setProperty(QTextFormat.FontSizeAdjustment, size_adjustment)
+                cursor.select(QTextCursor.LineUnderCursor)
+                cursor.mergeCharFormat(fmt)
+                self._text_edit.mergeCurrentCharFormat(fmt)
             else:
-                list_fmt.setIndent(block_fmt.indent() + 1)
-                block_fmt.setIndent(0)
+                block_fmt.setMarker(marker)
                 cursor.setBlockFormat(block_fmt)
-            list_fmt.setStyle(style)
-            cursor.createList(list_fmt)
-        cursor.endEditBlock()
+                list_fmt = QTextListFormat()
+                if cursor.currentList():
+                    list_fmt = cursor.currentList().format()
+                else:
+                    list_fmt.setIndent(block_fmt.indent() + 1)
+                    block_fmt.setIndent(0)
+                    cursor.setBlockFormat(block_fmt)
+                list_fmt.setStyle(style)
+                cursor.createList(list_fmt)
+            cursor.endEditBlock()
 
     @Slot()
     def text_color(self):
-        col = QColorDialog.getColor(self._text_edit.textColor(), self)
+        # currentCharFormat() exists on both editor classes, unlike
+        # QTextEdit.textColor(), so this stays safe after a plain-text
+        # load swaps in a QPlainTextEdit.
+        current = self._text_edit.currentCharFormat().foreground().color()
+        col = QColorDialog.getColor(current, self)
         if not col.isValid():
             return
         fmt = QTextCharFormat()
@@ -652,6 +1023,8 @@ class TextEdit(QMainWindow):
 
     @Slot(QAction)
     def text_align(self, a):
+        if not isinstance(self._text_edit, QTextEdit):
+            return
         if a == self._action_align_left:
             self._text_edit.setAlignment(Qt.AlignLeft | Qt.AlignAbsolute)
         elif a == self._action_align_center:
@@ -675,6 +1048,10 @@ class TextEdit(QMainWindow):
 
     def modify_indentation(self, amount):
         cursor = self._text_edit.textCursor()
+        with self._suppress_ui():
+            self._modify_indentation(cursor, amount)
+
+    def _modify_indentation(self, cursor, amount):
         cursor.beginEditBlock()
         if cursor.currentList():
             list_fmt = cursor.currentList().format()
@@ -696,49 +1073,52 @@ class TextEdit(QMainWindow):
 
     @Slot(QTextCharFormat)
     def current_char_format_changed(self, format):
+        if self._ui_silenced:
+            return
         self.font_changed(format.font())
         self.color_changed(format.foreground().color())
 
     @Slot()
     def cursor_position_changed(self):
-        self.alignment_changed(self._text_edit.alignment())
-        list = self._text_edit.textCursor().currentList()
-        if list:
-            style = list.format().style()
-            if style == QTextListFormat.ListDisc:
-                self._combo_style.setCurrentIndex(1)
-            elif style == QTextListFormat.ListCircle:
-                self._combo_style.setCurrentIndex(2)
-            elif style == QTextListFormat.ListSquare:
-                self._combo_style.setCurrentIndex(3)
-            elif style == QTextListFormat.ListDecimal:
-                self._combo_style.setCurrentIndex(6)
-            elif style == QTextListFormat.ListLowerAlpha:
-                self._combo_style.setCurrentIndex(7)
-            elif style == QTextListFormat.ListUpperAlpha:
-                self._combo_style.setCurrentIndex(8)
-            elif style == QTextListFormat.ListLowerRoman:
-                self._combo_style.setCurrentIndex(9)
-            elif style == QTextListFormat.ListUpperRoman:
-                self._combo_style.setCurrentIndex(10)
+        if self._ui_silenced:
+            return
+        if isinstance(self._text_edit, QTextEdit):
+            self.alignment_changed(self._text_edit.alignment())
+        # One textCursor()/blockFormat() round trip; each call crosses
+        # into Qt and copies the cursor.
+        cursor = self._text_edit.textCursor()
+        block_format = cursor.blockFormat()
+        list = cursor.currentList()
+        # These are reflections of document state, not user input:
+        # block the widgets so setChecked does not bounce through
+        # set_checked and re-edit the block we are reporting on.
+        with QSignalBlocker(self._combo_style), \
+                QSignalBlocker(self._action_toggle_check_state):
+            if list:
+                style = list.format().style()
+                self._combo_style.setCurrentIndex(
+                    _LIST_STYLE_INDEX.get(style, -1))
+                match block_format.marker():
+                    case _MARKER.NoMarker:
+                        self._action_toggle_check_state.setChecked(False)
+                    case _MARKER.Unchecked:
+                        self._combo_style.setCurrentIndex(4)
+                        self._action_toggle_check_state.setChecked(False)
+                    case _MARKER.Checked:
+                        self._combo_style.setCurrentIndex(5)
+                        self._action_toggle_check_state.setChecked(True)
             else:
-                self._combo_style.setCurrentIndex(-1)
-            marker = self._text_edit.textCursor().block().blockFormat().marker()
-            if marker == QTextBlockFormat.MarkerType.NoMarker:
-                self._action_toggle_check_state.setChecked(False)
-            elif marker == QTextBlockFormat.MarkerType.Unchecked:
-                self._combo_style.setCurrentIndex(4)
-                self._action_toggle_check_state.setChecked(False)
-            elif marker == QTextBlockFormat.MarkerType.Checked:
-                self._combo_style.setCurrentIndex(5)
-                self._action_toggle_check_state.setChecked(True)
-        else:
-            heading_level = self._text_edit.textCursor().blockFormat().headingLevel()
-            new_level = heading_level + 10 if heading_level != 0 else 0
-            self._combo_style.setCurrentIndex(new_level)
+                heading_level = block_format.headingLevel()
+                new_level = heading_level + 10 if heading_level != 0 else 0
+                self._combo_style.setCurrentIndex(new_level)
 
     @Slot()
     def clipboard_data_changed(self):
+        if not self._clip_timer.isActive():
+            self._clip_timer.start()
+
+    @Slot()
+    def _check_clipboard(self):
         md = QGuiApplication.clipboard().mimeData()
         self._action_paste.setEnabled(md and md.hasText())
 
@@ -748,107 +1128,167 @@ class TextEdit(QMainWindow):
 
     def merge_format_on_word_or_selection(self, format):
         cursor = self._text_edit.textCursor()
-        if not cursor.hasSelection():
-            cursor.select(QTextCursor.WordUnderCursor)
+        if cursor.hasSelection():
+            # mergeCurrentCharFormat would apply the format to the same
+            # selection a second time; one merge suffices here.
+            cursor.mergeCharFormat(format)
+            return
+        cursor.select(QTextCursor.WordUnderCursor)
         cursor.mergeCharFormat(format)
+        # Also update the editor's insertion format so typing at the
+        # cursor picks up the change.
         self._text_edit.mergeCurrentCharFormat(format)
 
     def font_changed(self, f):
-        index = self._combo_font.findText(QFontInfo(f).family())
-        self._combo_font.setCurrentIndex(index)
-        index = self._combo_size.findText(str(f.pointSize()))
-        self._combo_size.setCurrentIndex(index)
-        self._action_text_bold.setChecked(f.bold())
-        self._action_text_italic.setChecked(f.italic())
-        self._action_text_underline.setChecked(f.underline())
+        # Typing inside uniform text fires this with an unchanged font;
+        # setCurrentIndex/setChecked repaint even for no-op values, so
+        # only touch widgets whose state actually differs.
+        with QSignalBlocker(self._combo_font), \
+                QSignalBlocker(self._combo_size), \
+                QSignalBlocker(self._action_text_bold), \
+                QSignalBlocker(self._action_text_italic), \
+                QSignalBlocker(self._action_text_underline):
+            index = self._combo_font.findText(QFontInfo(f).family())
+            if index != self._combo_font.currentIndex():
+                self._combo_font.setCurrentIndex(index)
+            index = self._combo_size.findText(str(f.pointSize()))
+            if index != self._combo_size.currentIndex():
+                self._combo_size.setCurrentIndex(index)
+            if self._action_text_bold.isChecked() != f.bold():
+                self._action_text_bold.setChecked(f.bold())
+            if self._action_text_italic.isChecked() != f.italic():
+                self._action_text_italic.setChecked(f.italic())
+            if self._action_text_underline.isChecked() != f.underline():
+                self._action_text_underline.setChecked(f.underline())
 
     def color_changed(self, c):
-        pix = QPixmap(16, 16)
-        pix.fill(c)
-        self._action_text_color.setIcon(pix)
+        self._action_text_color.setIcon(_icon_for_color(c.rgba()))
+
+    # Only the horizontal bits select an action; vertical/absolute flags
+    # in the alignment value are masked off before the lookup.
+    _HALIGN_MASK = (Qt.AlignLeft | Qt.AlignHCenter | Qt.AlignRight
+                    | Qt.AlignJustify)
 
     def alignment_changed(self, a):
-        if a & Qt.AlignLeft:
-            self._action_align_left.setChecked(True)
-        elif a & Qt.AlignHCenter:
-            self._action_align_center.setChecked(True)
-        elif a & Qt.AlignRight:
-            self._action_align_right.setChecked(True)
-        elif a & Qt.AlignJustify:
-            self._action_align_justify.setChecked(True)
+        action = self._align_map.get(int(a & self._HALIGN_MASK))
+        if action is None:
+            return
+        # The group unchecks the others; skip the no-op re-check (and
+        # its repaint) when the alignment has not actually moved.
+        if not action.isChecked():
+            action.setChecked(True)
 
     @Slot()
     def insert_child(self) -> None:
         selection_model = self.view.selectionModel()
-        index: QModelIndex = selection_model.currentIndex()
         model: QAbstractItemModel = self.view.model()
+        # A persistent index tracks the parent through the mutations
+        # below, so no position recomputation is needed afterwards.
+        anchor = QPersistentModelIndex(selection_model.currentIndex())
 
-        if model.columnCount(index) == 0:
-            if not model.insertColumn(0, index):
-                return
-
-        if not model.insertRow(0, index):
+        if not model.insertRow(0, anchor):
             return
 
-        for column in range(model.columnCount(index)):
-            child: QModelIndex = model.index(0, column, index)
-            model.setData(child, "[No data]", Qt.EditRole)
-            if not model.headerData(column, Qt.Horizontal):
-                model.setHeaderData(column, Qt.Horizontal, "[No header]",
+        # fillRow writes the placeholders straight into the item and
+        # emits one row-spanning dataChanged.
+        model.fillRow(anchor, 0, "[No data]")
+
+        column_count = model.columnCount(anchor)
+        # Snapshot the headers up front; headerData inside the loop
+        # would re-query the model once per column. Binding the methods
+        # once also skips the per-iteration attribute lookups.
+        header_data = model.headerData
+        set_header_data = model.setHeaderData
+        headers = [header_data(column, Qt.Horizontal)
+                   for column in range(column_count)]
+        wrote_header = False
+        model.blockSignals(True)
+        try:
+            for column in range(column_count):
+                if not headers[column]:
+                    set_header_data(column, Qt.Horizontal, "[No header]",
                                     Qt.EditRole)
+                    wrote_header = True
+        finally:
+            model.blockSignals(False)
+        # Usually every header is already set and there is nothing to
+        # announce.
+        if wrote_header:
+            model.headerDataChanged.emit(Qt.Horizontal, 0, column_count - 1)
 
         selection_model.setCurrentIndex(
-            model.index(0, 0, index), QItemSelectionModel.ClearAndSelect
+            model.index(0, 0, anchor), self._CLEAR_AND_SELECT
         )
-        self.update_actions()
+        self._schedule_update_actions()
 
     @Slot()
     def insert_column(self) -> None:
-        model: QAbstractItemModel = self.view.model()
-        column: int = self.view.selectionModel().currentIndex().column()
+        view = self.view
+        model: QAbstractItemModel = view.model()
+        column: int = view.selectionModel().currentIndex().column()
 
         changed: bool = model.insertColumn(column + 1)
         if changed:
             model.setHeaderData(column + 1, Qt.Horizontal, "[No header]",
                                 Qt.EditRole)
 
-        self.update_actions()
+        self._schedule_update_actions()
 
     @Slot()
     def insert_row(self) -> None:
-        index: QModelIndex = self.view.selectionModel().currentIndex()
-        model: QAbstractItemModel = self.view.model()
-        parent: QModelIndex = index.parent()
+        view = self.view
+        index: QModelIndex = view.selectionModel().currentIndex()
+        model: QAbstractItemModel = view.model()
+        parent = QPersistentModelIndex(index.parent())
 
         if not model.insertRow(index.row() + 1, parent):
             return
 
-        self.update_actions()
+        self._schedule_update_actions()
 
-        for column in range(model.columnCount(parent)):
-            child: QModelIndex = model.index(index.row() + 1, column, parent)
-            model.setData(child, "[No data]", Qt.EditRole)
+        model.fillRow(parent, index.row() + 1, "[No data]")
 
     @Slot()
     def remove_column(self) -> None:
-        model: QAbstractItemModel = self.view.model()
-        column: int = self.view.selectionModel().currentIndex().column()
+        view = self.view
+        model: QAbstractItemModel = view.model()
+        column: int = view.selectionModel().currentIndex().column()
+
+        # Removing the last column would wipe every row and leave the
+        # model zero-wide, breaking the column-count invariant that
+        # insert_child and fillRow rely on.
+        if model.columnCount() <= 1:
+            return
 
         if model.removeColumn(column):
-            self.update_actions()
+            self._schedule_update_actions()
 
     @Slot()
     def remove_row(self) -> None:
-        index: QModelIndex = self.view.selectionModel().currentIndex()
-        model: QAbstractItemModel = self.view.model()
+        view = self.view
+        index: QModelIndex = view.selectionModel().currentIndex()
+        model: QAbstractItemModel = view.model()
 
         if model.removeRow(index.row(), index.parent()):
-            self.update_actions()
+            self._schedule_update_actions()
+
+    def _schedule_update_actions(self) -> None:
+        """Coalesce action/status refreshes: a burst of model edits in
+        one event-loop turn yields a single update_actions run."""
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._run_update_actions)
+
+    @Slot()
+    def _run_update_actions(self) -> None:
+        self._update_pending = False
+        self.update_actions()
 
     @Slot()
     def update_actions(self) -> None:
         selection_model = self.view.selectionModel()
-        has_selection: bool = not selection_model.selection().isEmpty()
+        selection = selection_model.selection()
+        has_selection: bool = not selection.isEmpty()
         self.remove_row_action.setEnabled(has_selection)
         self.remove_column_action.setEnabled(has_selection)
 
@@ -859,7 +1299,15 @@ class TextEdit(QMainWindow):
 
         if has_current:
             self.view.closePersistentEditor(current_index)
-            msg = f"Position: ({current_index.row()},{current_index.column()})"
-            if not current_index.parent().isValid():
-                msg += " in top level"
-            self.statusBar().showMessage(msg)
+            status_bar = self.statusBar()
+            # No point formatting a message nobody can see.
+            if status_bar.isVisible():
+                msg = f"Position: ({current_index.row()},{current_index.column()})"
+                if not current_index.parent().isValid():
+                    msg += " in top level"
+                # showMessage repaints the status bar even for an
+                # identical string; selection churn within one cell is
+                # common.
+                if msg != self._last_status:
+                    self._last_status = msg
+                    status_bar.showMessage(msg)
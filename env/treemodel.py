@@ -3,10 +3,21 @@
 
 
 from PySide6.QtCore import QModelIndex, Qt, QAbstractItemModel
-from treeitem import TreeItem
+try:
+    from .treeitem import TreeItem
+except ImportError:  # running flat from the source tree
+    from treeitem import TreeItem
 
 
 class TreeModel(QAbstractItemModel):
+    """Editable tree of TreeItem rows.
+
+    Invariant: every item has exactly root_item.column_count() columns.
+    Rows are created with that width (insertRows passes it down) and
+    column edits recurse through the whole tree, so columnCount can
+    answer from the root without probing the parent index and callers
+    never need to add columns to individual branches.
+    """
 
     def __init__(self, headers: list, data: str, parent=None):
         super().__init__(parent)
@@ -50,6 +61,38 @@ class TreeModel(QAbstractItemModel):
 
         return None
 
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # Cheaper than the default rowCount() probe for collapsed nodes;
+        # lets the view draw expansion arrows without visiting children.
+        if parent.isValid() and parent.column() > 0:
+            return False
+        return self.get_item(parent).child_count() > 0
+
+    def fillRow(self, parent: QModelIndex, row: int, value) -> bool:
+        """Set every column of one row to value, emitting a single
+        dataChanged for the whole row.
+
+        Going through setData per cell would route each write through
+        index()/get_item() and emit one dataChanged per column; callers
+        populating freshly inserted rows only need one notification.
+        """
+        item: TreeItem = self.get_item(parent).child(row)
+        if item is None:
+            return False
+
+        columns = item.column_count()
+        if columns == 0:
+            # Nothing to write, and the emit below would signal the
+            # inverted range 0..-1.
+            return False
+        for column in range(columns):
+            item.set_data(column, value)
+
+        self.dataChanged.emit(self.createIndex(row, 0, item),
+                              self.createIndex(row, columns - 1, item),
+                              [Qt.DisplayRole, Qt.EditRole])
+        return True
+
     def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
         if parent.isValid() and parent.column() != 0:
             return QModelIndex()